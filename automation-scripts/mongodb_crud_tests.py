@@ -4,6 +4,7 @@ Author: QA Engineer
 Description: Comprehensive testing for MongoDB basic operations
 """
 
+import sys
 import pytest
 from pymongo import MongoClient
 from datetime import datetime
@@ -266,6 +267,11 @@ class TestMongoDBIndexes:
         logger.info(f"Query time with index: {time_with_index:.4f}s")
 
 
+def run():
+    """Run the CRUD test suite, returning True if all tests pass"""
+    return pytest.main([__file__, "-v", "--tb=short"]) == 0
+
+
 if __name__ == "__main__":
     # Run tests
-    pytest.main([__file__, "-v", "--tb=short"])
+    sys.exit(0 if run() else 1)
@@ -669,7 +669,8 @@ class MongoDBDataValidator:
         return report, quality_results
 
 
-if __name__ == "__main__":
+def run():
+    """Run the data validation test suite and print a summary"""
     # Initialize and run validation tests
     validator = MongoDBDataValidator()
     report, quality_results = validator.run_full_validation_suite()
@@ -687,3 +688,9 @@ if __name__ == "__main__":
         print(f"  {result['check']}: {result['count']} ({result['percentage']:.2f}%)")
 
     print("\nFull report saved to: reports/validation_report_*.json")
+
+    return True
+
+
+if __name__ == "__main__":
+    run()
@@ -358,7 +358,8 @@ class MongoDBPerformanceTester:
         return report
 
 
-if __name__ == "__main__":
+def run():
+    """Run the performance test suite and print a summary"""
     # Initialize and run performance tests
     perf_tester = MongoDBPerformanceTester()
     report = perf_tester.run_full_performance_suite()
@@ -374,3 +375,9 @@ if __name__ == "__main__":
                 f"  Concurrent Ops Rate: {result['operations_per_second']:.2f} ops/sec"
             )
         print("---")
+
+    return True
+
+
+if __name__ == "__main__":
+    run()
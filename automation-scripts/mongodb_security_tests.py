@@ -505,7 +505,8 @@ class MongoDBSecurityTester:
         return report
 
 
-if __name__ == "__main__":
+def run():
+    """Run the security test suite and print a summary"""
     # Initialize and run security tests
     security_tester = MongoDBSecurityTester()
     report = security_tester.run_full_security_suite()
@@ -518,3 +519,9 @@ if __name__ == "__main__":
             print(f"  ✓ {test_case['test']}: {test_case['status']}")
 
     print("\nFull report saved to: reports/security_report_*.json")
+
+    return True
+
+
+if __name__ == "__main__":
+    run()
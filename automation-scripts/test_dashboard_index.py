@@ -0,0 +1,48 @@
+"""
+Dashboard Report Index Test Suite
+Author: QA Engineer
+Description: Tests for rebuilding the dashboard's report index
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+import orjson
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import dashboard  # noqa: E402
+
+
+class TestDashboardIndex:
+    """Test that the dashboard picks up reports written by standalone suites"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.reports_dir = tempfile.mkdtemp()
+        self.dashboard = dashboard.TestDashboard(reports_dir=self.reports_dir)
+
+    def teardown_method(self):
+        """Cleanup after each test"""
+        shutil.rmtree(self.reports_dir)
+
+    def write_report(self, filename, content):
+        with open(os.path.join(self.reports_dir, filename), "w") as f:
+            f.write(content)
+
+    def test_partial_report_is_retried(self):
+        """Test a report that fails to parse mid-write is indexed once complete"""
+        assert orjson.loads(self.dashboard.load_latest_results()) == {}
+
+        # Suite has only written part of the report when the dashboard polls
+        report = orjson.dumps({"security_results": [{"status": "PASS"}]}).decode()
+        self.write_report("security_report_20250101_000000.json", report[:10])
+        assert orjson.loads(self.dashboard.load_latest_results()) == {}
+
+        # Completing the same file leaves the directory mtime unchanged
+        self.write_report("security_report_20250101_000000.json", report)
+        assert orjson.loads(self.dashboard.load_latest_results()) == {
+            "security": orjson.loads(report)
+        }
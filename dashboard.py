@@ -4,84 +4,90 @@ Author: QA Engineer
 Description: Create interactive web dashboard for test results
 """
 
-import json
+import argparse
+import gzip
 import os
 from datetime import datetime
-from flask import Flask, render_template_string, jsonify
+from flask import Flask, Response, render_template_string
+import orjson
 import threading
 import webbrowser
 import time
 
+from report_index import INDEX_FILENAME, REPORT_PREFIXES, update_index
+
+
+def write_static_file(path, content):
+    """Atomically write a file plus the .gz copy served by gzip_static"""
+    for target, data in ((path, content), (f"{path}.gz", gzip.compress(content))):
+        tmp_path = f"{target}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, target)
+
 
 class TestDashboard:
     def __init__(self, reports_dir="reports", port=5000):
         self.reports_dir = reports_dir
         self.port = port
         self.app = Flask(__name__)
+        self._cached_body = b"{}"
+        self._cached_mtime = None
+        self._indexed_dir_mtime = None
         self.setup_routes()
 
+    def _reports_dir_mtime(self):
+        """Return the reports directory mtime, or -1 if it does not exist"""
+        try:
+            return os.stat(self.reports_dir).st_mtime_ns
+        except FileNotFoundError:
+            return -1
+
     def load_latest_results(self):
-        """Load the latest test results"""
-        results = {}
+        """Load the latest test results as serialized JSON"""
+        # Suites run standalone write their reports without touching the index.
+        # New reports change the directory mtime, so one stat tells whether the
+        # index has to be rebuilt.
+        dir_mtime = self._reports_dir_mtime()
+        if dir_mtime == -1:
+            # Reports directory does not exist yet, nothing to index
+            self._indexed_dir_mtime = dir_mtime
+        elif dir_mtime != self._indexed_dir_mtime:
+            # Only record the mtime after a successful rebuild. A report that is
+            # still being written fails to parse, and finishing it will not
+            # change the directory mtime, so the next request has to retry.
+            if update_index(self.reports_dir) is not None:
+                # Read after the rebuild, writing latest.json changes the mtime
+                self._indexed_dir_mtime = self._reports_dir_mtime()
 
-        try:
-            # Load summary
-            summary_files = [
-                f for f in os.listdir(self.reports_dir) if f.startswith("test_summary_")
-            ]
-            if summary_files:
-                latest_summary = sorted(summary_files)[-1]
-                with open(os.path.join(self.reports_dir, latest_summary), "r") as f:
-                    results["summary"] = json.load(f)
-
-            # Load performance results
-            perf_files = [
-                f
-                for f in os.listdir(self.reports_dir)
-                if f.startswith("performance_report_")
-            ]
-            if perf_files:
-                latest_perf = sorted(perf_files)[-1]
-                with open(os.path.join(self.reports_dir, latest_perf), "r") as f:
-                    results["performance"] = json.load(f)
-
-            # Load security results
-            security_files = [
-                f
-                for f in os.listdir(self.reports_dir)
-                if f.startswith("security_report_")
-            ]
-            if security_files:
-                latest_security = sorted(security_files)[-1]
-                with open(os.path.join(self.reports_dir, latest_security), "r") as f:
-                    results["security"] = json.load(f)
-
-            # Load validation results
-            validation_files = [
-                f
-                for f in os.listdir(self.reports_dir)
-                if f.startswith("validation_report_")
-            ]
-            if validation_files:
-                latest_validation = sorted(validation_files)[-1]
-                with open(os.path.join(self.reports_dir, latest_validation), "r") as f:
-                    results["validation"] = json.load(f)
+        index_path = os.path.join(self.reports_dir, INDEX_FILENAME)
 
+        try:
+            mtime = os.stat(index_path).st_mtime_ns
+            if mtime != self._cached_mtime:
+                with open(index_path, "rb") as f:
+                    body = f.read()
+                # Validate once per index change, then serve the bytes verbatim
+                orjson.loads(body)
+                self._cached_body, self._cached_mtime = body, mtime
+        except FileNotFoundError:
+            # Reports directory does not exist yet
+            self._cached_body, self._cached_mtime = b"{}", None
         except Exception as e:
             print(f"Error loading results: {e}")
 
-        return results
+        return self._cached_body
 
     def setup_routes(self):
         """Setup Flask routes"""
 
         @self.app.route("/")
         def dashboard():
-            return render_template_string(DASHBOARD_HTML)
+            return render_template_string(DASHBOARD_HTML, data_url="/api/data")
 
         @self.app.route("/api/data")
         def get_data():
-            return jsonify(self.load_latest_results())
+            return Response(self.load_latest_results(), mimetype="application/json")
 
     def run(self, open_browser=True):
         """Run the dashboard server"""
@@ -99,6 +105,61 @@ class TestDashboard:
 
         self.app.run(debug=False, port=self.port, host="0.0.0.0")
 
+    def emit_static(self, dist_dir="dist"):
+        """Write the dashboard page and data as static files for a web server"""
+        os.makedirs(dist_dir, exist_ok=True)
+
+        html = self.app.jinja_env.from_string(DASHBOARD_HTML).render(
+            data_url="data.json"
+        )
+        write_static_file(os.path.join(dist_dir, "index.html"), html.encode("utf-8"))
+        self.emit_static_data(dist_dir)
+
+    def emit_static_data(self, dist_dir="dist"):
+        """Refresh the report index and the static data.json copy"""
+        index = update_index(self.reports_dir)
+        if index is not None:
+            write_static_file(os.path.join(dist_dir, "data.json"), index)
+
+    def watch_static(self, dist_dir="dist"):
+        """Emit static files, then keep data.json in sync with new reports"""
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        dashboard = self
+        report_prefixes = tuple(REPORT_PREFIXES.values())
+
+        class ReportHandler(FileSystemEventHandler):
+            # Only events that mean a report changed. Reading the reports in
+            # update_index() raises opened/closed_no_write events, which must
+            # not trigger another rebuild.
+            def on_report_event(self, event):
+                path = getattr(event, "dest_path", "") or event.src_path
+                if not event.is_directory and os.path.basename(path).startswith(
+                    report_prefixes
+                ):
+                    dashboard.emit_static_data(dist_dir)
+
+            on_created = on_modified = on_moved = on_closed = on_report_event
+
+        os.makedirs(self.reports_dir, exist_ok=True)
+        self.emit_static(dist_dir)
+
+        observer = Observer()
+        observer.schedule(ReportHandler(), self.reports_dir, recursive=False)
+        observer.start()
+
+        print(f"📁 Static dashboard written to: {os.path.abspath(dist_dir)}")
+        print(f"👀 Watching {self.reports_dir}/ for new reports...")
+        print("Press Ctrl+C to stop the watcher")
+
+        try:
+            while observer.is_alive():
+                observer.join(1)
+        except KeyboardInterrupt:
+            observer.stop()
+        observer.join()
+
 
 # HTML Template for Dashboard
 DASHBOARD_HTML = """
@@ -108,7 +169,6 @@ DASHBOARD_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>MongoDB QA Dashboard</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
     <style>
         * { margin: 0; padding: 0; box-sizing: border-box; }
         body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; background: #f5f7fa; }
@@ -200,7 +260,7 @@ DASHBOARD_HTML = """
             document.getElementById('loading').style.display = 'block';
             document.getElementById('dashboard').style.display = 'none';
             
-            fetch('/api/data')
+            fetch('{{ data_url }}')
                 .then(response => response.json())
                 .then(data => {
                     updateDashboard(data);
@@ -233,50 +293,66 @@ DASHBOARD_HTML = """
         }
         
         function updateCharts(data) {
+            // Chart.js is deferred so the cards can render before it loads
+            if (typeof Chart === 'undefined') {
+                window.addEventListener('chartjs-ready', () => updateCharts(data), { once: true });
+                return;
+            }
+            
             const summary = data.summary || {};
             const suiteResults = summary.suite_results || {};
             
             // Suite Results Chart
-            const ctx1 = document.getElementById('suiteChart').getContext('2d');
-            if (suiteChart) suiteChart.destroy();
-            
             const suiteLabels = Object.keys(suiteResults).map(key => key.replace('_', ' ').replace(/\\b\\w/g, l => l.toUpperCase()));
             const suiteData = Object.values(suiteResults).map(status => status === 'PASS' ? 1 : 0);
             
-            suiteChart = new Chart(ctx1, {
-                type: 'doughnut',
-                data: {
-                    labels: suiteLabels,
-                    datasets: [{
-                        data: suiteData,
-                        backgroundColor: ['#28a745', '#dc3545', '#ffc107', '#17a2b8'],
-                        borderWidth: 2
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    plugins: {
-                        legend: { position: 'bottom' }
+            if (suiteChart) {
+                updateChartData(suiteChart, suiteLabels, suiteData);
+            } else {
+                const ctx1 = document.getElementById('suiteChart').getContext('2d');
+                suiteChart = new Chart(ctx1, {
+                    type: 'doughnut',
+                    data: {
+                        labels: suiteLabels,
+                        datasets: [{
+                            data: suiteData,
+                            backgroundColor: ['#28a745', '#dc3545', '#ffc107', '#17a2b8'],
+                            borderWidth: 2
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        plugins: {
+                            legend: { position: 'bottom' }
+                        }
                     }
-                }
-            });
+                });
+            }
             
             // Performance Chart
-            const ctx2 = document.getElementById('performanceChart').getContext('2d');
-            if (performanceChart) performanceChart.destroy();
+            const insertPerf = data.performance?.insert_performance;
+            
+            if (!insertPerf) {
+                if (performanceChart) performanceChart.destroy();
+                performanceChart = null;
+                return;
+            }
             
-            const performanceData = data.performance?.performance_results || [];
-            const insertPerf = performanceData.find(r => r.test_type === 'insert_performance');
+            const performanceLabels = ['Single Insert', 'Bulk Insert'];
+            const performanceData = [insertPerf.single_insert_rate || 0, insertPerf.bulk_insert_rate || 0];
             
-            if (insertPerf) {
+            if (performanceChart) {
+                updateChartData(performanceChart, performanceLabels, performanceData);
+            } else {
+                const ctx2 = document.getElementById('performanceChart').getContext('2d');
                 performanceChart = new Chart(ctx2, {
                     type: 'bar',
                     data: {
-                        labels: ['Single Insert', 'Bulk Insert'],
+                        labels: performanceLabels,
                         datasets: [{
                             label: 'Documents/Second',
-                            data: [insertPerf.single_insert_rate || 0, insertPerf.bulk_insert_rate || 0],
+                            data: performanceData,
                             backgroundColor: ['#FF6B6B', '#4ECDC4'],
                             borderWidth: 1
                         }]
@@ -292,6 +368,18 @@ DASHBOARD_HTML = """
             }
         }
         
+        function updateChartData(chart, labels, values) {
+            // Reuse the existing chart and skip the redraw when nothing changed
+            const dataset = chart.data.datasets[0];
+            if (JSON.stringify(chart.data.labels) === JSON.stringify(labels) &&
+                JSON.stringify(dataset.data) === JSON.stringify(values)) {
+                return;
+            }
+            chart.data.labels = labels;
+            dataset.data = values;
+            chart.update('none');
+        }
+        
         function updateTestResults(data) {
             const resultsContainer = document.getElementById('testResults');
             let html = '';
@@ -327,10 +415,26 @@ DASHBOARD_HTML = """
         // Auto-refresh every 30 seconds
         setInterval(loadData, 30000);
     </script>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js" crossorigin="anonymous" defer onload="window.dispatchEvent(new Event('chartjs-ready'))"></script>
 </body>
 </html>
 """
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MongoDB QA Dashboard")
+    parser.add_argument(
+        "--emit-static",
+        action="store_true",
+        help="Write index.html and data.json for a static web server and keep "
+        "data.json updated as reports arrive",
+    )
+    parser.add_argument(
+        "--dist-dir", default="dist", help="Output directory for --emit-static"
+    )
+    args = parser.parse_args()
+
     dashboard = TestDashboard()
-    dashboard.run()
+    if args.emit_static:
+        dashboard.watch_static(args.dist_dir)
+    else:
+        dashboard.run()
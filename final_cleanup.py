@@ -3,34 +3,91 @@
 Final Code Cleanup - Focus on Critical Issues
 """
 
+import argparse
+import os
 import subprocess
 
 
+def changed_python_files():
+    """Return Python files changed against HEAD, or None if git is unavailable"""
+    try:
+        # git reports paths relative to the repository root, not the cwd
+        root = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        changed = subprocess.run(
+            ["git", "diff", "--name-only", "HEAD", "--", "*.py"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=root,
+        ).stdout.split()
+        untracked = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard", "--", "*.py"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=root,
+        ).stdout.split()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    # Deleted files still show up in the diff
+    paths = (os.path.join(root, f) for f in set(changed + untracked))
+    return sorted(p for p in paths if os.path.exists(p))
+
+
 def main():
     """Run final cleanup with relaxed rules"""
+    parser = argparse.ArgumentParser(description="Final code cleanup")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Lint the whole repository instead of only changed files",
+    )
+    args = parser.parse_args()
 
-    print("🎨 Final formatting with Black...")
+    print("🎨 Final formatting with Ruff...")
     try:
         subprocess.run(
-            ["python", "-m", "black", ".", "--exclude", "venv", "--line-length", "88"],
+            ["ruff", "format", ".", "--extend-exclude", "venv", "--line-length", "88"],
             check=True,
         )
-        print("✅ Black formatting completed")
+        print("✅ Ruff formatting completed")
     except:
-        print("⚠️  Black had issues")
+        print("⚠️  Ruff formatter had issues")
+
+    # Formatter rewrites show up as working tree changes, so this covers them too
+    lint_targets = None if args.full else changed_python_files()
+    if lint_targets is None:
+        lint_targets = ["."]
+    elif not lint_targets:
+        print("ℹ️  No changed Python files, nothing was linted")
+        print("   Run with --full to check the whole repository")
+        return
 
     print("🔍 Running final quality check...")
     try:
         result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "flake8",
-                ".",
-                "--exclude=venv",
-                "--max-line-length=100",  # More relaxed
-                "--extend-ignore=E203,W503,E501,F401,F821,W293",  # Ignore most issues
-                "--count",
+            ["ruff", "check"]
+            + lint_targets
+            + [
+                "--extend-exclude",
+                "venv",
+                # Apply the exclude to explicitly passed changed files as well
+                "--force-exclude",
+                "--line-length",
+                "100",  # More relaxed
+                # flake8's default pycodestyle/pyflakes rule set; the E1/E2/E3
+                # and W2 pycodestyle rules are still preview rules in ruff
+                "--select",
+                "E,F,W",
+                "--preview",
+                "--ignore",
+                "E203,E501,F401,F821,W293",  # Ignore most issues
             ],
             capture_output=True,
             text=True,
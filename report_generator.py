@@ -4,146 +4,124 @@ Author: QA Engineer
 Description: Generate comprehensive test reports in multiple formats
 """
 
-import json
+import mmap
 import os
 from datetime import datetime
-import pandas as pd
-from jinja2 import Template
-import base64
-import io
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+import orjson
+import xlsxwriter
 
+# Result key -> JSON results file written for each test suite
+RESULT_FILES = {
+    "crud": "crud_test_results.json",
+    "performance": "performance_test_results.json",
+    "security": "security_test_results.json",
+    "validation": "data_validation_results.json",
+}
 
-class TestReportGenerator:
-    def __init__(self, reports_dir="reports"):
-        self.reports_dir = reports_dir
-        self.ensure_reports_dir()
 
-    def ensure_reports_dir(self):
-        """Ensure reports directory exists"""
-        if not os.path.exists(self.reports_dir):
-            os.makedirs(self.reports_dir)
+# Files above this size are parsed from a memory map instead of a bytes copy
+MMAP_THRESHOLD = 1024 * 1024
 
-    def load_latest_results(self):
-        """Load the latest test results from all test suites"""
-        results = {}
-
-        # Load CRUD test results
-        crud_file = os.path.join(self.reports_dir, "crud_test_results.json")
-        if os.path.exists(crud_file):
-            with open(crud_file, "r") as f:
-                results["crud"] = json.load(f)
-
-        # Load performance test results
-        perf_file = os.path.join(self.reports_dir, "performance_test_results.json")
-        if os.path.exists(perf_file):
-            with open(perf_file, "r") as f:
-                results["performance"] = json.load(f)
-
-        # Load security test results
-        security_file = os.path.join(self.reports_dir, "security_test_results.json")
-        if os.path.exists(security_file):
-            with open(security_file, "r") as f:
-                results["security"] = json.load(f)
-
-        # Load data validation results
-        validation_file = os.path.join(self.reports_dir, "data_validation_results.json")
-        if os.path.exists(validation_file):
-            with open(validation_file, "r") as f:
-                results["validation"] = json.load(f)
-
-        # Load summary
-        summary_files = [
-            f for f in os.listdir(self.reports_dir) if f.startswith("test_summary_")
-        ]
-        if summary_files:
-            latest_summary = sorted(summary_files)[-1]
-            with open(os.path.join(self.reports_dir, latest_summary), "r") as f:
-                results["summary"] = json.load(f)
-
-        return results
-
-    def create_performance_charts(self, performance_data):
-        """Create performance visualization charts"""
-        charts = {}
 
-        if "performance_results" in performance_data:
-            # Insert Performance Chart
-            plt.figure(figsize=(10, 6))
-            insert_data = [
-                result
-                for result in performance_data["performance_results"]
-                if result.get("test_type") == "insert_performance"
-            ]
+def load_json(path):
+    """Load a JSON file, returning None if it does not exist"""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size <= MMAP_THRESHOLD:
+                return orjson.loads(f.read())
 
-            if insert_data:
-                data = insert_data[0]
-                categories = ["Single Insert Rate", "Bulk Insert Rate"]
-                values = [
-                    data.get("single_insert_rate", 0),
-                    data.get("bulk_insert_rate", 0),
-                ]
-
-                plt.bar(categories, values, color=["#FF6B6B", "#4ECDC4"])
-                plt.title("MongoDB Insert Performance Comparison")
-                plt.ylabel("Documents/Second")
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-
-                # Save to base64 string
-                buffer = io.BytesIO()
-                plt.savefig(buffer, format="png", dpi=300, bbox_inches="tight")
-                buffer.seek(0)
-                charts["insert_performance"] = base64.b64encode(
-                    buffer.getvalue()
-                ).decode()
-                plt.close()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    except FileNotFoundError:
+        return None
 
-            # Query Performance Chart
-            plt.figure(figsize=(10, 6))
-            query_data = [
-                result
-                for result in performance_data["performance_results"]
-                if result.get("test_type") == "query_performance"
-            ]
 
-            if query_data:
-                data = query_data[0]
-                operations = ["Find One", "Find Many", "Aggregation"]
-                times = [
-                    data.get("find_one_time", 0),
-                    data.get("find_many_time", 0),
-                    data.get("aggregation_time", 0),
-                ]
-
-                plt.bar(operations, times, color=["#95E1D3", "#F3D250", "#F38BA8"])
-                plt.title("MongoDB Query Performance")
-                plt.ylabel("Time (seconds)")
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-
-                buffer = io.BytesIO()
-                plt.savefig(buffer, format="png", dpi=300, bbox_inches="tight")
-                buffer.seek(0)
-                charts["query_performance"] = base64.b64encode(
-                    buffer.getvalue()
-                ).decode()
-                plt.close()
+def _file_mtime(path):
+    """Return the file's mtime in nanoseconds, or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
-        return charts
 
-    def generate_html_report(self):
-        """Generate comprehensive HTML report"""
-        results = self.load_latest_results()
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+def _excel_value(value):
+    """Cell value for xlsxwriter, which cannot write nested lists or dicts"""
+    if isinstance(value, (list, dict)):
+        return str(value)
+    return value
+
+
+def _write_sheet(workbook, name, headers, rows, header_format=None):
+    """Write a header row followed by the given rows to a new worksheet"""
+    worksheet = workbook.add_worksheet(name)
+    worksheet.write_row(0, 0, headers, header_format)
+    for row_num, row in enumerate(rows, 1):
+        worksheet.write_row(row_num, 0, row)
+
+
+def _write_records(workbook, name, records, header_format=None):
+    """Write a list of result dicts as a sheet, one column per key"""
+    # Columns in first-seen order across all records
+    headers = list(dict.fromkeys(key for record in records for key in record))
+    rows = (
+        [_excel_value(record.get(header)) for header in headers] for record in records
+    )
+    _write_sheet(workbook, name, headers, rows, header_format)
+
+
+def _display_name(key):
+    """Turn a snake_case test key into a table label"""
+    return key.replace("_", " ").title()
 
-        # Create performance charts
-        charts = {}
-        if "performance" in results:
-            charts = self.create_performance_charts(results["performance"])
 
-        html_template = """
-<!DOCTYPE html>
+def _status_class(status):
+    """CSS class for a PASS/FAIL status badge"""
+    return "pass" if status == "PASS" else "fail"
+
+
+def _prepare_security_rows(rows):
+    """(name, status class, status, details) tuples for the security table"""
+    return [
+        (
+            _display_name(r.get("test_type") or ""),
+            _status_class(r.get("status")),
+            r.get("status") or "",
+            r.get("details") or "",
+        )
+        for r in rows
+    ]
+
+
+def _prepare_validation_rows(rows):
+    """(name, status class, status, records, success %) tuples for validation"""
+    return [
+        (
+            _display_name(r.get("test_type") or ""),
+            _status_class(r.get("status")),
+            r.get("status") or "",
+            r.get("records_processed") or "N/A",
+            f"{(r.get('success_rate') or 0) * 100:.1f}",
+        )
+        for r in rows
+    ]
+
+
+def _prepare_quality_rows(rows):
+    """(name, pass %) tuples for the data quality metrics"""
+    return [
+        (
+            _display_name(r.get("check_type") or ""),
+            f"{(r.get('pass_rate') or 0) * 100:.1f}",
+        )
+        for r in rows
+    ]
+
+
+# HTML Template for Report, split so only the middle section goes through Jinja
+_HTML_HEADER = r"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -174,7 +152,7 @@ class TestReportGenerator:
         .status.pass { color: #28a745; }
         .status.fail { color: #dc3545; }
         .chart { text-align: center; margin: 20px 0; }
-        .chart img { max-width: 100%; height: auto; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
+        .chart canvas { max-width: 100%; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
         .metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }
         .metric { background: #f8f9fa; padding: 15px; border-radius: 5px; text-align: center; }
         .metric .label { font-size: 0.9em; color: #666; margin-bottom: 5px; }
@@ -191,7 +169,9 @@ class TestReportGenerator:
 </head>
 <body>
     <div class="container">
-        <div class="header">
+"""
+
+_HTML_BODY_TEMPLATE_SRC = r"""        <div class="header">
             <h1>🗄️ MongoDB QA Test Report</h1>
             <p>Comprehensive Database Testing Report</p>
             <p><strong>Generated:</strong> {{ timestamp }}</p>
@@ -481,14 +461,14 @@ class TestReportGenerator:
                 {% if charts.insert_performance %}
                 <div class="chart">
                     <h4>Insert Performance Comparison</h4>
-                    <img src="data:image/png;base64,{{ charts.insert_performance }}" alt="Insert Performance Chart">
+                    <canvas id="insert_performance"></canvas>
                 </div>
                 {% endif %}
                 
                 {% if charts.query_performance %}
                 <div class="chart">
                     <h4>Query Performance Analysis</h4>
-                    <img src="data:image/png;base64,{{ charts.query_performance }}" alt="Query Performance Chart">
+                    <canvas id="query_performance"></canvas>
                 </div>
                 {% endif %}
                 
@@ -617,11 +597,11 @@ class TestReportGenerator:
                         </tr>
                     </thead>
                     <tbody>
-                        {% for test in security.security_results %}
+                        {% for name, cls, status, details in security_rows %}
                         <tr>
-                            <td>{{ test.test_type|title|replace('_', ' ') }}</td>
-                            <td><span class="status {% if test.status == 'PASS' %}pass{% else %}fail{% endif %}">{{ test.status }}</span></td>
-                            <td>{{ test.details }}</td>
+                            <td>{{ name }}</td>
+                            <td><span class="status {{ cls }}">{{ status }}</span></td>
+                            <td>{{ details|e }}</td>
                         </tr>
                         {% endfor %}
                     </tbody>
@@ -723,18 +703,18 @@ class TestReportGenerator:
                     </table>
                 </div>
                 
-                {% if validation.data_quality_results %}
+                {% if quality_rows %}
                 <div class="metrics">
-                    {% for result in validation.data_quality_results %}
+                    {% for name, pass_pct in quality_rows %}
                     <div class="metric">
-                        <div class="label">{{ result.check_type|title|replace('_', ' ') }}</div>
-                        <div class="value">{{ "%.1f"|format(result.pass_rate * 100) }}%</div>
+                        <div class="label">{{ name }}</div>
+                        <div class="value">{{ pass_pct }}%</div>
                     </div>
                     {% endfor %}
                 </div>
                 {% endif %}
                 
-                {% if validation.validation_results %}
+                {% if validation_rows %}
                 <table>
                     <thead>
                         <tr>
@@ -745,12 +725,12 @@ class TestReportGenerator:
                         </tr>
                     </thead>
                     <tbody>
-                        {% for test in validation.validation_results %}
+                        {% for name, cls, status, records, success_pct in validation_rows %}
                         <tr>
-                            <td>{{ test.test_type|title|replace('_', ' ') }}</td>
-                            <td><span class="status {% if test.status == 'PASS' %}pass{% else %}fail{% endif %}">{{ test.status }}</span></td>
-                            <td>{{ test.records_processed if test.records_processed else 'N/A' }}</td>
-                            <td>{{ "%.1f"|format((test.success_rate if test.success_rate else 0) * 100) }}%</td>
+                            <td>{{ name }}</td>
+                            <td><span class="status {{ cls }}">{{ status }}</span></td>
+                            <td>{{ records }}</td>
+                            <td>{{ success_pct }}%</td>
                         </tr>
                         {% endfor %}
                     </tbody>
@@ -765,40 +745,233 @@ class TestReportGenerator:
             <h4>📋 Recommendations</h4>
             <ul>
                 {% for recommendation in summary.recommendations %}
-                <li>{{ recommendation }}</li>
+                <li>{{ recommendation|e }}</li>
                 {% endfor %}
             </ul>
         </div>
         {% endif %}
 
-        <div class="footer">
+        {% if charts %}
+        <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js" crossorigin="anonymous"></script>
+        <script>
+            const charts = {{ chart_json|safe }};
+            Object.entries(charts).forEach(([id, chart]) => {
+                new Chart(document.getElementById(id), {
+                    type: 'bar',
+                    data: {
+                        labels: chart.labels,
+                        datasets: [{
+                            label: chart.label,
+                            data: chart.values,
+                            backgroundColor: chart.colors,
+                            borderWidth: 1
+                        }]
+                    },
+                    options: {
+                        scales: {
+                            y: { beginAtZero: true }
+                        }
+                    }
+                });
+            });
+        </script>
+        {% endif %}
+
+"""
+
+_HTML_FOOTER = r"""        <div class="footer">
             <p><strong>MongoDB QA Portfolio</strong> | Generated by Automated Test Suite</p>
             <p>Portfolio by: QA Engineer | Technology: MongoDB + Python + PyTest</p>
         </div>
     </div>
 </body>
 </html>
+"""
+
+
+def _bytecode_cache():
+    """Per-user bytecode cache in the temp directory, or None if unavailable"""
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+# Single environment; the report template is compiled once at import and its
+# bytecode is cached on disk so fresh processes skip parsing it as well. The
+# cache lives in the temp directory so read-only checkouts can still import this.
+_ENV = Environment(
+    loader=DictLoader({"report.html": _HTML_BODY_TEMPLATE_SRC}),
+    bytecode_cache=_bytecode_cache(),
+    # Trust boundary: the report only renders results written by our own test
+    # suites, so values are emitted as-is. Free-text fields that can carry
+    # arbitrary strings (details, recommendations) are escaped with |e.
+    autoescape=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_HTML_TEMPLATE = _ENV.get_template("report.html")
+
+
+class TestReportGenerator:
+    def __init__(self, reports_dir="reports"):
+        self.reports_dir = reports_dir
+        # Resolved once; every report path is joined onto it
+        self.reports_path = os.path.abspath(reports_dir)
+        self._cached_results = None
+        self._cached_key = None
+        self.ensure_reports_dir()
+
+    def ensure_reports_dir(self):
+        """Ensure reports directory exists"""
+        if not os.path.exists(self.reports_path):
+            os.makedirs(self.reports_path)
+
+    def load_latest_results(self):
+        """Load the latest test results from all test suites
+
+        The results are cached on this instance and reused by the HTML and Excel
+        reports until a result file is added, removed or modified.
         """
+        result_paths = {
+            key: os.path.join(self.reports_path, filename)
+            for key, filename in RESULT_FILES.items()
+        }
 
-        template = Template(html_template)
-        html_content = template.render(
-            timestamp=timestamp,
-            summary=results.get("summary", {}).get("test_execution_summary", {}),
-            crud=results.get("crud"),
-            performance=results.get("performance"),
-            security=results.get("security"),
-            validation=results.get("validation"),
-            charts=charts,
-        )
+        # Latest summary; timestamped names sort chronologically
+        with os.scandir(self.reports_path) as entries:
+            latest_summary = max(
+                (e for e in entries if e.name.startswith("test_summary_")),
+                key=lambda e: e.name,
+                default=None,
+            )
+        if latest_summary is not None:
+            result_paths["summary"] = latest_summary.path
+
+        # One stat per file tells whether the cached results are still current
+        cache_key = tuple((path, _file_mtime(path)) for path in result_paths.values())
+        if cache_key == self._cached_key:
+            return self._cached_results
+
+        # The reads are I/O bound, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=len(result_paths)) as executor:
+            results = executor.map(load_json, result_paths.values())
+            self._cached_results = {
+                key: data
+                for key, data in zip(result_paths, results)
+                if data is not None
+            }
+        self._cached_key = cache_key
+
+        return self._cached_results
+
+    def performance_chart_data(self, performance_data):
+        """Collect performance chart data for client-side rendering"""
+        charts = {}
+
+        if "performance_results" in performance_data:
+            # Bucket results by test type in a single pass
+            results_by_type = {}
+            for result in performance_data["performance_results"]:
+                results_by_type.setdefault(result.get("test_type"), []).append(result)
+
+            # Insert Performance Chart
+            insert_data = results_by_type.get("insert_performance", [])
+
+            if insert_data:
+                data = insert_data[0]
+                charts["insert_performance"] = {
+                    "labels": ["Single Insert Rate", "Bulk Insert Rate"],
+                    "values": [
+                        data.get("single_insert_rate", 0),
+                        data.get("bulk_insert_rate", 0),
+                    ],
+                    "colors": ["#FF6B6B", "#4ECDC4"],
+                    "label": "Documents/Second",
+                }
+
+            # Query Performance Chart
+            query_data = results_by_type.get("query_performance", [])
+
+            if query_data:
+                data = query_data[0]
+                charts["query_performance"] = {
+                    "labels": ["Find One", "Find Many", "Aggregation"],
+                    "values": [
+                        data.get("find_one_time", 0),
+                        data.get("find_many_time", 0),
+                        data.get("aggregation_time", 0),
+                    ],
+                    "colors": ["#95E1D3", "#F3D250", "#F38BA8"],
+                    "label": "Time (seconds)",
+                }
+
+        return charts
+
+    def generate_html_report(self):
+        """Generate comprehensive HTML report"""
+        results = self.load_latest_results()
+        generated_at = datetime.now()
+        timestamp = f"{generated_at:%Y-%m-%d %H:%M:%S}"
+
+        # Pass suites without any results as None so Jinja skips their whole
+        # section instead of walking empty tables
+        performance = results.get("performance")
+        if not (performance or {}).get("performance_results"):
+            performance = None
+
+        security = results.get("security")
+        security_results = (security or {}).get("security_results")
+        if not security_results:
+            security = None
+
+        validation = results.get("validation") or {}
+        validation_results = validation.get("validation_results")
+        quality_results = validation.get("data_quality_results")
+        if not (validation_results or quality_results):
+            validation = None
+
+        # Performance charts are drawn in the browser by Chart.js
+        charts = {}
+        if performance:
+            charts = self.performance_chart_data(performance)
 
         # Save HTML report
-        report_filename = (
-            f"mongodb_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        )
-        report_path = os.path.join(self.reports_dir, report_filename)
+        report_filename = f"mongodb_test_report_{generated_at:%Y%m%d_%H%M%S}.html"
+        report_path = os.path.join(self.reports_path, report_filename)
 
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        summary = results.get("summary", {}).get("test_execution_summary", {})
+
+        # Stream rendered fragments through a 64 KiB buffer instead of building
+        # one large string, so memory stays bounded for big result sets. The
+        # output goes to a temporary file first so a failed render never leaves
+        # a truncated report behind.
+        tmp_path = f"{report_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+                f.write(_HTML_HEADER)
+                _HTML_TEMPLATE.stream(
+                    timestamp=timestamp,
+                    summary=summary,
+                    crud=results.get("crud"),
+                    performance=performance,
+                    security=security,
+                    validation=validation,
+                    # Table rows are flattened to tuples so the loops only unpack
+                    security_rows=_prepare_security_rows(security_results or []),
+                    validation_rows=_prepare_validation_rows(validation_results or []),
+                    quality_rows=_prepare_quality_rows(quality_results or []),
+                    charts=charts,
+                    # Chart values come from the result files, so escape "<" to
+                    # keep strings like "</script>" from closing the block
+                    chart_json=orjson.dumps(charts).replace(b"<", b"\\u003c").decode(),
+                ).dump(f)
+                f.write(_HTML_FOOTER)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, report_path)
 
         return report_path
 
@@ -808,67 +981,87 @@ class TestReportGenerator:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         report_filename = f"mongodb_test_report_{timestamp}.xlsx"
-        report_path = os.path.join(self.reports_dir, report_filename)
+        report_path = os.path.join(self.reports_path, report_filename)
+
+        # Rows are written straight from the result dicts, no DataFrame round-trip
+        # Keep cell text literal: no automatic hyperlinks or formulas from
+        # result strings, matching the previous pandas/openpyxl output
+        with xlsxwriter.Workbook(
+            report_path, {"strings_to_urls": False, "strings_to_formulas": False}
+        ) as workbook:
+            header_format = workbook.add_format({"bold": True, "border": 1})
 
-        with pd.ExcelWriter(report_path, engine="openpyxl") as writer:
             # Summary Sheet
             if "summary" in results:
                 summary_data = results["summary"].get("test_execution_summary", {})
                 suite_results = results["summary"].get("suite_results", {})
 
-                summary_df = pd.DataFrame(
-                    [
-                        ["Test Execution Summary", ""],
-                        ["Timestamp", summary_data.get("timestamp", "")],
-                        ["Total Suites", summary_data.get("total_suites", 0)],
-                        ["Passed Suites", summary_data.get("passed_suites", 0)],
-                        ["Failed Suites", summary_data.get("failed_suites", 0)],
-                        ["Overall Status", summary_data.get("overall_status", "")],
-                        ["", ""],
-                        ["Suite Results", ""],
-                    ]
-                    + [
-                        [k.replace("_", " ").title(), v]
-                        for k, v in suite_results.items()
-                    ],
-                    columns=["Metric", "Value"],
-                )
+                summary_rows = [
+                    ["Test Execution Summary", ""],
+                    ["Timestamp", summary_data.get("timestamp", "")],
+                    ["Total Suites", summary_data.get("total_suites", 0)],
+                    ["Passed Suites", summary_data.get("passed_suites", 0)],
+                    ["Failed Suites", summary_data.get("failed_suites", 0)],
+                    ["Overall Status", summary_data.get("overall_status", "")],
+                    ["", ""],
+                    ["Suite Results", ""],
+                ] + [[k.replace("_", " ").title(), v] for k, v in suite_results.items()]
 
-                summary_df.to_excel(writer, sheet_name="Summary", index=False)
+                _write_sheet(
+                    workbook,
+                    "Summary",
+                    ["Metric", "Value"],
+                    summary_rows,
+                    header_format,
+                )
 
             # CRUD Results Sheet
             if "crud" in results and "test_results" in results["crud"]:
-                crud_df = pd.DataFrame(results["crud"]["test_results"])
-                crud_df.to_excel(writer, sheet_name="CRUD Tests", index=False)
+                _write_records(
+                    workbook,
+                    "CRUD Tests",
+                    results["crud"]["test_results"],
+                    header_format,
+                )
 
             # Performance Results Sheet
             if (
                 "performance" in results
                 and "performance_results" in results["performance"]
             ):
-                perf_df = pd.DataFrame(results["performance"]["performance_results"])
-                perf_df.to_excel(writer, sheet_name="Performance Tests", index=False)
+                _write_records(
+                    workbook,
+                    "Performance Tests",
+                    results["performance"]["performance_results"],
+                    header_format,
+                )
 
             # Security Results Sheet
             if "security" in results and "security_results" in results["security"]:
-                security_df = pd.DataFrame(results["security"]["security_results"])
-                security_df.to_excel(writer, sheet_name="Security Tests", index=False)
+                _write_records(
+                    workbook,
+                    "Security Tests",
+                    results["security"]["security_results"],
+                    header_format,
+                )
 
             # Data Validation Results Sheet
             if "validation" in results:
                 if "validation_results" in results["validation"]:
-                    validation_df = pd.DataFrame(
-                        results["validation"]["validation_results"]
-                    )
-                    validation_df.to_excel(
-                        writer, sheet_name="Data Validation", index=False
+                    _write_records(
+                        workbook,
+                        "Data Validation",
+                        results["validation"]["validation_results"],
+                        header_format,
                     )
 
                 if "data_quality_results" in results["validation"]:
-                    quality_df = pd.DataFrame(
-                        results["validation"]["data_quality_results"]
+                    _write_records(
+                        workbook,
+                        "Data Quality",
+                        results["validation"]["data_quality_results"],
+                        header_format,
                     )
-                    quality_df.to_excel(writer, sheet_name="Data Quality", index=False)
 
         return report_path
 
@@ -889,4 +1082,4 @@ if __name__ == "__main__":
     print(f"✅ Excel report saved: {excel_report}")
 
     print("\n🎉 Report generation completed!")
-    print(f"📁 Reports saved in: {os.path.abspath(generator.reports_dir)}")
+    print(f"📁 Reports saved in: {generator.reports_path}")
@@ -0,0 +1,82 @@
+"""
+MongoDB QA Report Index
+Author: QA Engineer
+Description: Maintain a merged index of the latest test reports
+"""
+
+import os
+import re
+
+import orjson
+
+INDEX_FILENAME = "latest.json"
+
+# Index key -> filename prefix of the timestamped JSON reports
+REPORT_PREFIXES = {
+    "summary": "test_summary_",
+    "performance": "performance_report_",
+    "security": "security_report_",
+    "validation": "validation_report_",
+}
+
+_PREFIX_KEYS = {prefix: key for key, prefix in REPORT_PREFIXES.items()}
+_REPORT_PATTERN = re.compile(
+    "^(" + "|".join(re.escape(prefix) for prefix in _PREFIX_KEYS) + ")"
+)
+
+
+def find_latest_reports(reports_dir="reports"):
+    """Return the path of the newest report for each index key"""
+    latest = {}
+
+    # Single directory pass; timestamped names sort chronologically
+    with os.scandir(reports_dir) as entries:
+        for entry in entries:
+            match = _REPORT_PATTERN.match(entry.name)
+            if match:
+                key = _PREFIX_KEYS[match.group(1)]
+                if key not in latest or entry.name > latest[key].name:
+                    latest[key] = entry
+
+    return {key: entry.path for key, entry in latest.items()}
+
+
+def index_performance_results(report):
+    """Key performance results by test type for direct lookups"""
+    results = report.get("results", report.get("performance_results", []))
+    return {result["test_type"]: result for result in results if "test_type" in result}
+
+
+def update_index(reports_dir="reports"):
+    """Merge the latest reports into a single index file and return its bytes
+
+    Returns None when a report cannot be read, leaving any previous index in place.
+    """
+    parts = []
+
+    try:
+        for key, path in find_latest_reports(reports_dir).items():
+            with open(path, "rb") as f:
+                report = f.read()
+            # Parse once to reject corrupt reports, the bytes are reused as-is
+            data = orjson.loads(report)
+            if key == "performance":
+                report = orjson.dumps(index_performance_results(data))
+            parts.append(b'"' + key.encode() + b'":' + report)
+    except Exception as e:
+        print(f"Error updating report index: {e}")
+        return None
+
+    index = b"{" + b",".join(parts) + b"}"
+
+    try:
+        # Write to a temporary file first so readers never see a partial index
+        index_path = os.path.join(reports_dir, INDEX_FILENAME)
+        tmp_path = f"{index_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(index)
+        os.replace(tmp_path, index_path)
+    except Exception as e:
+        print(f"Error updating report index: {e}")
+
+    return index
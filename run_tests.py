@@ -8,39 +8,64 @@ Description: Main test runner that executes all MongoDB QA test suites
 import os
 import sys
 import argparse
-import json
+import importlib
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import subprocess
 
+import orjson
+
+from report_index import update_index
+
 # Add the automation-scripts directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), "automation-scripts"))
 
 
-def run_command(command):
-    """Run a command and return the result"""
+def run_command(command, capture=True):
+    """Run a command given as an argv list and return the result
+
+    With capture=False the child writes straight to this process's stdout and
+    stderr, so long runs show live progress without buffering output in memory.
+    """
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        result = subprocess.run(command, capture_output=capture, text=True)
         return {
             "success": result.returncode == 0,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stdout": result.stdout or "",
+            "stderr": result.stderr or "",
             "return_code": result.returncode,
         }
     except Exception as e:
         return {"success": False, "stdout": "", "stderr": str(e), "return_code": -1}
 
 
+def run_suite(module_name, isolated=False):
+    """Run a test suite module in-process, or in its own interpreter if isolated"""
+    if isolated:
+        script = os.path.join("automation-scripts", f"{module_name}.py")
+        return run_command([sys.executable, script], capture=False)
+
+    try:
+        success = importlib.import_module(module_name).run()
+        return {"success": success, "stderr": ""}
+    except Exception:
+        return {"success": False, "stderr": traceback.format_exc()}
+
+
 def setup_environment():
     """Setup test environment"""
     print("Setting up test environment...")
 
-    # Create reports directory
-    os.makedirs("reports", exist_ok=True)
-    os.makedirs("data/test-db", exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
+    # Create working directories; in steady state they already exist
+    for directory in ("reports", "data/test-db", "logs"):
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
 
     # Check if MongoDB is running
-    mongo_check = run_command("mongosh --eval 'db.runCommand({ping: 1})' --quiet")
+    mongo_check = run_command(
+        ["mongosh", "--eval", "db.runCommand({ping: 1})", "--quiet"]
+    )
     if not mongo_check["success"]:
         print(
             "⚠️  Warning: MongoDB may not be running. Please ensure MongoDB is started."
@@ -55,8 +80,11 @@ def run_functional_tests():
     """Run functional test suite"""
     print("\n🧪 Running Functional Tests...")
 
-    # Run CRUD tests
-    result = run_command("python automation-scripts/mongodb_crud_tests.py")
+    # Run CRUD tests. They are a pytest session, which must not share the
+    # interpreter with the other suites: pytest's log capture handlers are
+    # process-wide, and a module imported before collection skips assertion
+    # rewriting. So this suite always runs in its own process.
+    result = run_suite("mongodb_crud_tests", isolated=True)
     if result["success"]:
         print("✅ CRUD tests completed successfully")
     else:
@@ -66,11 +94,11 @@ def run_functional_tests():
     return result["success"]
 
 
-def run_performance_tests():
+def run_performance_tests(isolated=False):
     """Run performance test suite"""
     print("\n⚡ Running Performance Tests...")
 
-    result = run_command("python automation-scripts/mongodb_performance_tests.py")
+    result = run_suite("mongodb_performance_tests", isolated)
     if result["success"]:
         print("✅ Performance tests completed successfully")
     else:
@@ -80,11 +108,11 @@ def run_performance_tests():
     return result["success"]
 
 
-def run_security_tests():
+def run_security_tests(isolated=False):
     """Run security test suite"""
     print("\n🔒 Running Security Tests...")
 
-    result = run_command("python automation-scripts/mongodb_security_tests.py")
+    result = run_suite("mongodb_security_tests", isolated)
     if result["success"]:
         print("✅ Security tests completed successfully")
     else:
@@ -94,11 +122,11 @@ def run_security_tests():
     return result["success"]
 
 
-def run_data_validation_tests():
+def run_data_validation_tests(isolated=False):
     """Run data validation test suite"""
     print("\n📊 Running Data Validation Tests...")
 
-    result = run_command("python automation-scripts/mongodb_data_validation.py")
+    result = run_suite("mongodb_data_validation", isolated)
     if result["success"]:
         print("✅ Data validation tests completed successfully")
     else:
@@ -108,6 +136,46 @@ def run_data_validation_tests():
     return result["success"]
 
 
+# Suite name -> runner taking the isolated flag, in report order
+SUITE_RUNNERS = {
+    # The pytest-based CRUD suite always runs in its own process
+    "functional": lambda isolated: run_functional_tests(),
+    "performance": run_performance_tests,
+    "security": run_security_tests,
+    "validation": run_data_validation_tests,
+}
+
+
+# Suites that measure timings and must not share mongod with other suites
+EXCLUSIVE_SUITES = ("performance",)
+
+
+def run_test_suites(suites, serial=False, isolated=False):
+    """Run the given test suites and return their results"""
+    if serial:
+        return {suite: SUITE_RUNNERS[suite](isolated) for suite in suites}
+
+    # Suites use separate databases and mostly wait on MongoDB, so overlap them
+    parallel = [suite for suite in suites if suite not in EXCLUSIVE_SUITES]
+    results = {}
+    if len(parallel) > 1:
+        with ThreadPoolExecutor(max_workers=len(parallel)) as executor:
+            futures = {
+                suite: executor.submit(SUITE_RUNNERS[suite], isolated)
+                for suite in parallel
+            }
+        results = {suite: future.result() for suite, future in futures.items()}
+
+    # Anything left (a single suite or the timing suites) runs on its own after
+    # the others finish, so their load does not skew the measurements
+    for suite in suites:
+        if suite not in results:
+            results[suite] = SUITE_RUNNERS[suite](isolated)
+
+    # Keep report order
+    return {suite: results[suite] for suite in suites}
+
+
 def load_test_data():
     """Load sample test data into MongoDB"""
     print("\n📥 Loading test data...")
@@ -133,13 +201,17 @@ def generate_summary_report(results):
 
     timestamp = datetime.now()
 
+    # Suite results are bools, so one sum gives the pass count
+    total_suites = len(results)
+    passed_suites = sum(map(bool, results.values()))
+
     report = {
         "test_execution_summary": {
             "timestamp": timestamp.isoformat(),
-            "total_suites": len(results),
-            "passed_suites": sum(1 for r in results.values() if r),
-            "failed_suites": sum(1 for r in results.values() if not r),
-            "overall_status": "PASS" if all(results.values()) else "FAIL",
+            "total_suites": total_suites,
+            "passed_suites": passed_suites,
+            "failed_suites": total_suites - passed_suites,
+            "overall_status": "PASS" if passed_suites == total_suites else "FAIL",
         },
         "suite_results": {
             "functional_tests": "PASS" if results.get("functional", False) else "FAIL",
@@ -162,11 +234,14 @@ def generate_summary_report(results):
 
     # Save summary report
     report_filename = f"reports/test_summary_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
-    with open(report_filename, "w") as f:
-        json.dump(report, f, indent=2)
+    with open(report_filename, "wb") as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
 
     print(f"✅ Summary report saved to: {report_filename}")
 
+    # Refresh the merged index read by the dashboard
+    update_index("reports")
+
     # Print summary to console
     print("\n" + "=" * 60)
     print("📊 TEST EXECUTION SUMMARY")
@@ -200,6 +275,17 @@ def main():
     parser.add_argument(
         "--load-data", action="store_true", help="Load test data before running tests"
     )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run test suites one at a time instead of in parallel "
+        "(the performance suite always runs on its own)",
+    )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each test suite in its own Python process",
+    )
 
     args = parser.parse_args()
 
@@ -216,21 +302,9 @@ def main():
     if args.load_data:
         load_test_data()
 
-    # Track test results
-    results = {}
-
     # Run selected test suites
-    if args.suite in ["all", "functional"]:
-        results["functional"] = run_functional_tests()
-
-    if args.suite in ["all", "performance"]:
-        results["performance"] = run_performance_tests()
-
-    if args.suite in ["all", "security"]:
-        results["security"] = run_security_tests()
-
-    if args.suite in ["all", "validation"]:
-        results["validation"] = run_data_validation_tests()
+    suites = [suite for suite in SUITE_RUNNERS if args.suite in ["all", suite]]
+    results = run_test_suites(suites, serial=args.serial, isolated=args.isolated)
 
     # Generate summary report
     summary_report = generate_summary_report(results)
@@ -17,14 +17,21 @@ def main():
         print("Please run tests first: python run_tests.py")
         return
 
-    # Find latest HTML report
-    html_files = [f for f in os.listdir(reports_dir) if f.endswith(".html")]
+    # Scan the directory once; the entries are reused for the listing below
+    with os.scandir(reports_dir) as it:
+        entries = list(it)
 
-    if html_files:
-        latest_html = sorted(html_files)[-1]
-        html_path = os.path.abspath(os.path.join(reports_dir, latest_html))
+    # Find latest HTML report by modification time
+    latest_html = max(
+        (e for e in entries if e.name.endswith(".html")),
+        key=lambda e: e.stat().st_mtime,
+        default=None,
+    )
 
-        print(f"📊 Opening test report: {latest_html}")
+    if latest_html is not None:
+        html_path = os.path.abspath(latest_html.path)
+
+        print(f"📊 Opening test report: {latest_html.name}")
         print(f"📁 Location: {html_path}")
 
         # Open in browser
@@ -36,7 +43,7 @@ def main():
 
     # List all available reports
     print(f"\n📋 Available Reports in {reports_dir}/:")
-    for file in sorted(os.listdir(reports_dir)):
+    for file in sorted(e.name for e in entries):
         print(f"  - {file}")
 
 